@@ -5,7 +5,7 @@ Electric Stimulation - NI-DAQmx trigger generator for electrical stimulation.
 Modules:
 - trigger_generator_backend: DAQWorker, build_channel_path, re-exports LED helpers
 - led_pattern: build_led_pattern, led_pattern_dimensions (NumPy only)
-- experiment_io: JSON record builders for saved runs
+- experiment_io: WorkerParams and JSON record builders for saved runs
 - trigger_generator_gui: TriggerGeneratorWindow, main()
 """
 
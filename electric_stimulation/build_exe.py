@@ -8,21 +8,29 @@ Usage:
 Prerequisites:
     pip install -r requirements.txt pyinstaller
 
-The executable will be generated in dist/ (in the current directory).
+The application folder is generated in dist/TriggerGenerator/ (in the current
+directory), with a zip of that folder next to it for distribution.
+One-folder mode starts faster than one-file mode, which unpacks to a temp dir on every launch.
+Records saved by a previous build (dist/TriggerGenerator/experiences/) are kept across
+rebuilds and are never put in the zip.
 """
 
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 import tempfile
 
 SCRIPT_DIR = Path(__file__).resolve().parent
+# Folder the frozen app saves records in, next to its executable (see experiment_io).
+EXPERIENCES_DIRNAME = "experiences"
 
 
 def main():
     output_dir = Path.cwd() / "dist"
+    app_dir = output_dir / "TriggerGenerator"
     exe_name = "TriggerGenerator.exe" if sys.platform == "win32" else "TriggerGenerator"
-    exe_path = output_dir / exe_name
+    exe_path = app_dir / exe_name
 
     if exe_path.exists():
         try:
@@ -32,27 +40,62 @@ def main():
             print("Close Trigger Generator and try again.")
             sys.exit(1)
 
+    # --noconfirm lets PyInstaller delete the previous app folder, records included:
+    # park them in dist/ (same filesystem, so a rename) until the build and zip are done.
+    experiences = app_dir / EXPERIENCES_DIRNAME
+    parked = None
+    if experiences.exists():
+        parked = Path(tempfile.mkdtemp(prefix=".experiences-", dir=output_dir))
+        experiences.rename(parked / EXPERIENCES_DIRNAME)
+    try:
+        archive = _build(output_dir, app_dir)
+    finally:
+        if parked is not None:
+            app_dir.mkdir(parents=True, exist_ok=True)
+            (parked / EXPERIENCES_DIRNAME).rename(experiences)
+            parked.rmdir()
+    print(f"\n✓ Executable created: {exe_path}")
+    print(f"✓ Archive created: {archive}")
+
+
+def _build(output_dir, app_dir):
+    """Run PyInstaller into app_dir and zip it; returns the archive path."""
     launcher = SCRIPT_DIR / "run_trigger_generator_gui.py"
     with tempfile.TemporaryDirectory() as tmp:
         cmd = [
             sys.executable, "-m", "PyInstaller",
             "--name=TriggerGenerator",
             "--windowed",
-            "--onefile",
+            "--onedir",
+            "--noconfirm",
             "--clean",
             "--distpath", str(output_dir),
             "--specpath", tmp,
             "--workpath", tmp,
-            "--hidden-import=PyQt5",
-            "--hidden-import=PyQt5.QtCore",
-            "--hidden-import=PyQt5.QtGui",
-            "--hidden-import=PyQt5.QtWidgets",
+            # PyQt5.QtCore/QtGui/QtWidgets are imported directly and found by PyInstaller's hooks.
             "--hidden-import=numpy",
             "--hidden-import=PyDAQmx",
+            "--exclude-module=matplotlib",
+            "--exclude-module=scipy",
+            "--exclude-module=PyQt5.QtWebEngine",
+            "--exclude-module=PyQt5.QtWebEngineCore",
+            "--exclude-module=PyQt5.QtWebEngineWidgets",
+            "--exclude-module=PyQt5.Qt3DCore",
+            "--exclude-module=PyQt5.Qt3DRender",
+            "--exclude-module=PyQt5.QtQml",
+            "--exclude-module=PyQt5.QtQuick",
+            "--exclude-module=PyQt5.QtMultimedia",
+            "--exclude-module=PyQt5.QtSql",
+            # UPX (when installed) breaks Qt and MSVC runtime DLLs.
+            "--upx-exclude=Qt5Core.dll",
+            "--upx-exclude=Qt5Gui.dll",
+            "--upx-exclude=Qt5Widgets.dll",
+            "--upx-exclude=qwindows.dll",
+            "--upx-exclude=vcruntime140.dll",
             str(launcher.resolve()),
         ]
         subprocess.run(cmd, check=True, cwd=Path.cwd())
-    print(f"\n✓ Executable created: {exe_path}")
+    return shutil.make_archive(str(app_dir), "zip", output_dir, app_dir.name)
 
 
 if __name__ == "__main__":
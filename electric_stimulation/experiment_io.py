@@ -4,20 +4,113 @@ Paths and JSON payload for saved experiment parameters (no PyQt dependency).
 """
 
 import json
+import os
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
 
+# Optional: orjson (C implementation) for reading/writing records; stdlib json otherwise.
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    orjson = None
+
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+# Resolved once: neither sys.frozen nor the install location changes while running.
+if getattr(sys, "frozen", False):
+    _APP_DIR = Path(sys.executable).parent
+else:
+    _APP_DIR = Path(__file__).resolve().parent
+_EXPERIENCES_DIR = _APP_DIR / "experiences"
+# Saved record names (current and legacy prefix), matched in one test per directory entry.
+_JSON_RE = re.compile(r"^(trigger_generator_|wavegene_).*\.json$")
+
 
 def app_dir():
     """Directory next to frozen exe, or package directory when running from source."""
-    if getattr(sys, "frozen", False):
-        return Path(sys.executable).parent
-    return Path(__file__).resolve().parent
+    return _APP_DIR
 
 
 def experiences_dir():
-    return app_dir() / "experiences"
+    return _EXPERIENCES_DIR
+
+
+class WorkerParams:
+    """Parameters snapshotted at Start; read once then by the phase schedule, and by the saved record."""
+
+    __slots__ = (
+        "device",
+        "channel",
+        "sampling_rate",
+        "initial_trigger_delay",
+        "trigger",
+        "interval",
+        "infinite",
+        "nb_triggers",
+        "mode",
+        "led_train_samples",
+        "led_timer_samples",
+        "led_train_duration_s",
+        "led_nb_clignotement",
+        "led_duty_clignotement",
+        "led_light_intensity",
+        "led_inter_train_interval",
+        "led_voltage_high",
+        "led_voltage_low",
+    )
+
+    def __init__(self, **params):
+        for name in self.__slots__:
+            try:
+                setattr(self, name, params.pop(name))
+            except KeyError:
+                raise TypeError(f"Missing worker parameter: {name}") from None
+        if params:
+            raise TypeError(f"Unknown worker parameters: {', '.join(sorted(params))}")
+
+
+def latest_experiment_file(directory=None):
+    """
+    Most recently modified trigger_generator_*.json / wavegene_*.json, or None.
+    Single scandir pass; DirEntry.stat() is cached (free on Windows).
+    """
+    directory = experiences_dir() if directory is None else directory
+    best, best_mtime = None, -1.0
+    try:
+        it = os.scandir(directory)
+    except FileNotFoundError:
+        return None
+    with it:
+        for entry in it:
+            if not _JSON_RE.match(entry.name):
+                continue
+            mtime = entry.stat().st_mtime
+            if mtime > best_mtime:
+                best, best_mtime = entry.path, mtime
+    return Path(best) if best is not None else None
+
+
+def has_experiment_file(directory=None):
+    """True if directory holds any trigger_generator_*.json / wavegene_*.json (names only, no stat)."""
+    directory = experiences_dir() if directory is None else directory
+    try:
+        it = os.scandir(directory)
+    except FileNotFoundError:
+        return False
+    with it:
+        return any(_JSON_RE.match(entry.name) for entry in it)
 
 
 def build_experiment_record(worker_params, duration_seconds, start_time, end_time=None):
@@ -26,30 +119,39 @@ def build_experiment_record(worker_params, duration_seconds, start_time, end_tim
         end_time = datetime.now()
     p = worker_params
     return {
-        "device": p.get("device", "Dev2"),
-        "channel": p.get("channel", "ao0"),
-        "sampling_rate": p.get("sampling_rate", 1000),
-        "trigger_duration": p.get("trigger", 0.2),
-        "inter_trigger_interval": p.get("interval", 20),
-        "initial_trigger_delay": p.get("initial_trigger_delay", 5),
-        "infinite": p.get("infinite", True),
-        "nb_triggers": p.get("nb_triggers", 5),
-        "mode": p.get("mode", "classic"),
-        "led_train_duration_s": p.get("led_train_duration_s", 1.0),
-        "led_nb_clignotement": p.get("led_nb_clignotement", 1),
-        "led_duty_clignotement": p.get("led_duty_clignotement", 1.0),
-        "led_light_intensity": p.get("led_light_intensity", 1.0),
-        "led_inter_train_interval": p.get("led_inter_train_interval", 2.0),
-        "led_voltage_high": p.get("led_voltage_high", 3.0),
-        "led_voltage_low": p.get("led_voltage_low", 0.0),
+        "device": p.device,
+        "channel": p.channel,
+        "sampling_rate": p.sampling_rate,
+        "trigger_duration": p.trigger,
+        "inter_trigger_interval": p.interval,
+        "initial_trigger_delay": p.initial_trigger_delay,
+        "infinite": p.infinite,
+        "nb_triggers": p.nb_triggers,
+        "mode": p.mode,
+        "led_train_duration_s": p.led_train_duration_s,
+        "led_nb_clignotement": p.led_nb_clignotement,
+        "led_duty_clignotement": p.led_duty_clignotement,
+        "led_light_intensity": p.led_light_intensity,
+        "led_inter_train_interval": p.led_inter_train_interval,
+        "led_voltage_high": p.led_voltage_high,
+        "led_voltage_low": p.led_voltage_low,
         "duration_seconds": round(duration_seconds, 2),
         "start_time": start_time.strftime("%Y-%m-%d %H:%M:%S"),
         "end_time": end_time.strftime("%Y-%m-%d %H:%M:%S"),
     }
 
 
+def load_experiment_record(filepath):
+    """Parsed record from a trigger_generator_*.json / wavegene_*.json file."""
+    return _json_loads(Path(filepath).read_bytes())
+
+
 def save_experiment_record(record, filepath):
     filepath = Path(filepath)
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(record, f, indent=2, ensure_ascii=False)
+    data = _json_dumps(record)
+    try:
+        filepath.write_bytes(data)
+    except FileNotFoundError:
+        # Folder missing (first save, or removed meanwhile): create it only then.
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_bytes(data)
@@ -3,6 +3,8 @@
 LED stimulation waveform (NumPy only): one train = fixed duration, N blinks, duty, light intensity PWM.
 """
 
+import math
+
 import numpy as np
 
 
@@ -11,7 +13,7 @@ def led_pattern_dimensions(sampling_rate_hz, train_duration_s, inter_train_inter
     Sample counts for one LED buffer. Train length = ceil(sampling_rate_hz * train_duration_s).
     Returns (train_samples, timer_samples) where timer includes inter-train pause.
     """
-    train_samples = int(np.ceil(sampling_rate_hz * train_duration_s))
+    train_samples = int(math.ceil(sampling_rate_hz * train_duration_s))
     pause_samples = max(0, int(inter_train_interval_s * sampling_rate_hz))
     timer = train_samples + pause_samples
     return train_samples, timer
@@ -70,29 +72,24 @@ def build_led_pattern(
         starts[1:] = np.cumsum(lengths[:-1])
 
     avg_cell = train_samples / float(n_cycles)
-    pulse_w = int(np.ceil(avg_cell * train_duty))
+    pulse_w = int(math.ceil(avg_cell * train_duty))
     pulse_w = max(0, min(pulse_w, base))
     if pulse_w <= 0:
         return sig
 
     ws = np.minimum(pulse_w, lengths)
-    active = np.zeros(train_samples, dtype=bool)
-    for k in range(n_cycles):
-        w = int(ws[k])
-        if w <= 0:
-            continue
-        s = int(starts[k])
-        active[s : s + w] = True
-
-    idx_on = np.flatnonzero(active)
-    l_act = int(idx_on.size)
+    # Active sample indices in one pass: the first ws[k] samples of each slot k.
+    l_act = int(ws.sum())
+    first_on = np.cumsum(ws) - ws
+    idx_on = np.repeat(starts - first_on, ws) + np.arange(l_act, dtype=np.intp)
     k_low = max(0, min(l_act, int(round(l_act * light_intensity))))
 
     sig[:train_samples] = voltage_high
     if k_low >= l_act:
         sig[idx_on] = voltage_low
     elif k_low > 0:
-        i = np.arange(l_act, dtype=np.intp)
-        pick = (i + 1) * k_low // l_act > i * k_low // l_act
+        # floor(i * k_low / l_act) computed once; a sample is picked where it steps up.
+        q = np.arange(l_act + 1, dtype=np.intp) * k_low // l_act
+        pick = q[1:] > q[:-1]
         sig[idx_on[pick]] = voltage_low
     return sig
@@ -6,8 +6,11 @@ Backend for NI-DAQmx trigger generation.
 - led_pattern_dimensions / build_led_pattern re-exported from led_pattern (GUI compatibility).
 """
 
+import inspect
+import threading
 import time
-from ctypes import byref, c_int32
+from contextlib import contextmanager
+from ctypes import byref, c_int32, c_uint32
 
 import numpy as np
 from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
@@ -27,6 +30,21 @@ except ImportError:
 
 _AO_MIN_V = -10.0
 _AO_MAX_V = 10.0
+_TRIGGER_V = 3.0
+# Driver wait slice when the done event cannot be registered (stop is seen within it).
+_DONE_POLL_S = 1.0
+# Samples-written count shared by every WriteAnalogF64 call; the value is never read and
+# one generation runs at a time (the GUI allows a single worker).
+_READ = c_int32()
+# One-sample buffer for the idle write fallback; only touched under DAQWorker._idle_tasks_lock.
+_IDLE_SAMPLE = np.zeros(1, dtype=np.float64)
+# Longest delay block written to the device; longer delays regenerate it.
+_DELAY_BLOCK_S = 1.0
+# Finite runs with a delay are streamed: host buffer length and the number of blocks
+# it is refilled in (a stop request is seen within one block).
+_STREAM_BUF_S = 1.0
+_STREAM_BLOCKS = 10
+_ZERO_POOL = np.zeros(0, dtype=np.float64)
 
 
 def build_channel_path(device_str, channel_str):
@@ -39,6 +57,21 @@ def build_channel_path(device_str, channel_str):
     return f"{dev}/{ch}" if ch else dev
 
 
+def _build_trigger_cycle(trigger_samples, interval_samples):
+    """One classic cycle as a C-contiguous float64 buffer: trigger at 3 V, then 0 V."""
+    sig_cycle = np.zeros(trigger_samples + interval_samples, dtype=np.float64)
+    sig_cycle[:trigger_samples] = _TRIGGER_V
+    return sig_cycle
+
+
+def _zeros(n):
+    """n zeros sliced from a shared pool grown on demand; callers must not write to it."""
+    global _ZERO_POOL
+    if _ZERO_POOL.size < n:
+        _ZERO_POOL = np.zeros(n, dtype=np.float64)
+    return _ZERO_POOL[:n]
+
+
 def _daq_stop_clear(task):
     if task is None:
         return
@@ -61,6 +94,10 @@ class DAQWorker(QObject):
     error = pyqtSignal(str)
     started = pyqtSignal()
 
+    # Idle-voltage tasks kept per channel path and reused on every stop.
+    _idle_tasks = {}
+    _idle_tasks_lock = threading.Lock()
+
     def __init__(self, device, sampling_rate, trigger_duration, inter_trigger_interval,
                  infinite, nb_triggers, initial_trigger_delay=5.0, mode="classic",
                  led_train_duration_s=1.0, led_nb_clignotement=1,
@@ -68,260 +105,343 @@ class DAQWorker(QObject):
                  led_inter_train_interval=2.0,
                  led_voltage_high=3.0, led_voltage_low=0.0):
         super().__init__()
-        self.device = device
-        self.sampling_rate = sampling_rate
-        self.trigger_duration = trigger_duration
-        self.inter_trigger_interval = inter_trigger_interval
-        self.infinite = infinite
-        self.nb_triggers = nb_triggers
-        self.initial_trigger_delay = initial_trigger_delay
-        self.mode = mode
-        self.led_train_duration_s = led_train_duration_s
-        self.led_nb_clignotement = led_nb_clignotement
-        self.led_duty_clignotement = led_duty_clignotement
-        self.led_light_intensity = led_light_intensity
-        self.led_inter_train_interval = led_inter_train_interval
-        self.led_voltage_high = led_voltage_high
-        self.led_voltage_low = led_voltage_low
-        self._stop_requested = False
+        self._stop_event = threading.Event()
+        # Set by stop() and by the task's DAQmx done event; the only wakeups while waiting.
+        self._wake = threading.Event()
+        self._done_cb = None
+        self._done_event_ok = False
+        self.configure(
+            device, sampling_rate, trigger_duration, inter_trigger_interval,
+            infinite, nb_triggers, initial_trigger_delay, mode,
+            led_train_duration_s, led_nb_clignotement, led_duty_clignotement,
+            led_light_intensity, led_inter_train_interval,
+            led_voltage_high, led_voltage_low)
+
+    def configure(self, *args, **kwargs):
+        """
+        Set parameters for the next run() and rebuild its buffers. Takes the
+        constructor's arguments, with the same defaults; each is stored under its name.
+        Call only while the worker is idle; the same worker is reused across runs.
+        """
+        params = _WORKER_SIGNATURE.bind(self, *args, **kwargs)
+        params.apply_defaults()
+        for name, value in params.arguments.items():
+            if name != "self":
+                setattr(self, name, value)
+        self._stop_event.clear()
+        # Buffers are built here, on the caller's thread, so run() goes straight to the device.
+        self._delay_samples = 0
+        self._delay_data = None
+        self._cycle = None
+        self._build_error = None
+        try:
+            self._build_buffers()
+        except ValueError as e:
+            self._build_error = str(e)
+        except Exception as e:
+            # e.g. MemoryError for a very long LED train: configure() runs on the GUI
+            # thread, so report it through run() rather than raise out of a slot.
+            self._build_error = f"Could not build the output buffers: {e!r}"
 
     def stop(self):
         """Request worker to stop (called from main thread)."""
-        self._stop_requested = True
+        self._stop_event.set()
+        self._wake.set()
+
+    def _build_buffers(self):
+        """
+        Initial-delay block and the single cycle the device regenerates during output
+        (finite runs with a delay stream both instead, see _stream_finite).
+        """
+        initial_delay_samples = int(self.initial_trigger_delay * self.sampling_rate)
+        # The delay holds one level, so at most _DELAY_BLOCK_S of it is buffered.
+        delay_block = min(
+            initial_delay_samples, max(1, int(_DELAY_BLOCK_S * self.sampling_rate)))
+        if self.mode == "led":
+            sig_one = build_led_pattern(
+                self.sampling_rate,
+                self.led_train_duration_s,
+                self.led_nb_clignotement,
+                self.led_duty_clignotement,
+                self.led_light_intensity,
+                self.led_inter_train_interval,
+                self.led_voltage_high,
+                self.led_voltage_low,
+            )
+            if initial_delay_samples > 0:
+                self._delay_samples = initial_delay_samples
+                self._delay_data = np.full(
+                    delay_block, self.led_voltage_high, dtype=np.float64)
+            self._cycle = sig_one
+            return
+
+        trigger_samples = int(self.trigger_duration * self.sampling_rate)
+        interval_samples = int(self.inter_trigger_interval * self.sampling_rate)
+        if initial_delay_samples > 0:
+            self._delay_samples = initial_delay_samples
+            self._delay_data = _zeros(delay_block)
+        self._cycle = _build_trigger_cycle(trigger_samples, interval_samples)
 
     def _create_ao_task(self):
         task = nidaq.Task()
-        task.CreateAOVoltageChan(
-            self.device, None, _AO_MIN_V, _AO_MAX_V, nidaq.DAQmx_Val_Volts, None)
+        try:
+            task.CreateAOVoltageChan(
+                self.device, None, _AO_MIN_V, _AO_MAX_V, nidaq.DAQmx_Val_Volts, None)
+        except Exception:
+            _daq_stop_clear(task)
+            raise
         return task
 
+    @contextmanager
+    def _ao_task(self):
+        """AO task on self.device, stopped and cleared however the block exits."""
+        task = self._create_ao_task()
+        try:
+            self._done_event_ok = self._register_done_event(task)
+            yield task
+        finally:
+            _daq_stop_clear(task)
+
+    def _start_output(self, task, data, sample_mode, nb_samples=None):
+        """
+        Write data in a single call and start the task. A finite run of nb_samples
+        longer than data regenerates data until nb_samples have been output.
+        """
+        # DAQmx has no float32 AO write: the driver scales float64 volts to DAC codes on
+        # the host and only those codes cross the bus, so buffers are built as float64
+        # directly and this is a no-op rather than a conversion copy.
+        data = np.ascontiguousarray(data, dtype=np.float64)
+        buf_len = len(data)
+        if nb_samples is None:
+            nb_samples = buf_len
+        task.CfgSampClkTiming(
+            "", self.sampling_rate, nidaq.DAQmx_Val_Rising, sample_mode, nb_samples)
+        # Size the buffer to this data explicitly: a task reused after the delay phase
+        # would otherwise keep the previous buffer.
+        task.CfgOutputBuffer(buf_len)
+        self._cfg_regen(task, buf_len, sample_mode)
+        task.WriteAnalogF64(
+            buf_len, False, 10, nidaq.DAQmx_Val_GroupByScanNumber,
+            data, byref(_READ), None)
+        task.StartTask()
+
+    def _run_initial_delay(self, task):
+        """
+        Output the initial delay as a finite run, then stop the task so the
+        same channel reservation is reconfigured for the stimulation buffer.
+        """
+        self._start_output(
+            task, self._delay_data, nidaq.DAQmx_Val_FiniteSamps, self._delay_samples)
+        self._wait_until_task_done(task, self.initial_trigger_delay + 5)
+        task.StopTask()
+
+    def _stream_finite(self, task):
+        """
+        Finite run with an initial delay: the delay and nb_triggers cycles are one
+        clocked stream, so the first cycle starts exactly initial_trigger_delay after
+        StartTask. Written in blocks without regeneration; nothing is tiled in memory.
+        """
+        sr = self.sampling_rate
+        total = self._delay_samples + self.nb_triggers * len(self._cycle)
+        buf_len = min(total, max(1, int(_STREAM_BUF_S * sr)))
+        block = max(1, buf_len // _STREAM_BLOCKS)
+        task.CfgSampClkTiming("", sr, nidaq.DAQmx_Val_Rising, nidaq.DAQmx_Val_FiniteSamps, total)
+        task.SetWriteRegenMode(nidaq.DAQmx_Val_DoNotAllowRegen)
+        task.CfgOutputBuffer(buf_len)
+        write_timeout = buf_len / sr + 10
+        pos = 0
+        started = False
+        while pos < total:
+            # Prefill exactly one buffer before starting, then refill block by block.
+            n = min(block, (total if started else buf_len) - pos)
+            task.WriteAnalogF64(
+                n, False, write_timeout, nidaq.DAQmx_Val_GroupByScanNumber,
+                self._stream_chunk(pos, n), byref(_READ), None)
+            pos += n
+            if not started and (pos == buf_len or pos == total):
+                task.StartTask()
+                self.started.emit()
+                started = True
+            if self._stop_event.is_set():
+                return
+        self._wait_until_task_done(task, total / sr + 10)
+
+    def _stream_chunk(self, pos, n):
+        """Samples [pos, pos + n) of the delay-then-cycles stream."""
+        # _delay_data is a constant block at the delay level (at most _DELAY_BLOCK_S long).
+        delay = self._delay_data
+        delay_n = min(n, max(0, self._delay_samples - pos))
+        if delay_n == n and n <= len(delay):
+            return delay[:n]
+        out = np.empty(n, dtype=np.float64)
+        if delay_n:
+            out[:delay_n] = delay[0]
+        start = pos + delay_n - self._delay_samples
+        out[delay_n:] = self._cycle.take(np.arange(start, start + n - delay_n), mode="wrap")
+        return out
+
+    def _cfg_regen(self, task, buf_len, sample_mode):
+        """
+        Let the device loop the written buffer without host refills.
+        Continuous output stays on device memory only when the buffer fits the
+        onboard FIFO; settings the device does not support are skipped.
+        """
+        try:
+            task.SetWriteRegenMode(nidaq.DAQmx_Val_AllowRegen)
+        except Exception:
+            return
+        onbrd_size = c_uint32()
+        try:
+            task.GetBufOutputOnbrdBufSize(byref(onbrd_size))
+            # Set explicitly each phase: the task is reused after the delay.
+            task.SetAOUseOnlyOnBrdMem(
+                self.device,
+                sample_mode == nidaq.DAQmx_Val_ContSamps and buf_len <= onbrd_size.value)
+        except Exception:
+            pass
+
+    def _register_done_event(self, task):
+        """Have the driver set self._wake when task finishes. False if it cannot."""
+        if self._done_cb is None:
+            def on_done(task_handle, status, callback_data):
+                self._wake.set()
+                return 0
+            # Kept on the worker: the driver calls it for as long as the task lives.
+            self._done_cb = nidaq.DAQmxDoneEventCallbackPtr(on_done)
+        try:
+            task.RegisterDoneEvent(0, self._done_cb, None)
+        except Exception:
+            return False
+        return True
+
     def _wait_until_task_done(self, task, timeout_s):
-        """Poll WaitUntilTaskDone until success, stop requested, or timeout. Returns True if done."""
-        elapsed = 0.0
-        while not self._stop_requested and elapsed < timeout_s:
+        """
+        Wait for task completion, stop request, or timeout. Returns True if done.
+        Sleeps until the done event or stop() wakes it; without a done event, blocks
+        in the driver in _DONE_POLL_S slices.
+        """
+        deadline = time.monotonic() + timeout_s
+        while True:
+            # Cleared before the checks below, so a wake after them is not lost.
+            self._wake.clear()
+            remaining = deadline - time.monotonic()
+            slice_s = 0.0 if self._done_event_ok else max(0.0, min(_DONE_POLL_S, remaining))
             try:
-                task.WaitUntilTaskDone(1.0)
+                task.WaitUntilTaskDone(slice_s)
                 return True
             except Exception:
-                elapsed += 1.0
-        return False
+                pass
+            if self._stop_event.is_set() or remaining <= 0:
+                return False
+            if self._done_event_ok:
+                self._wake.wait(remaining)
 
     @pyqtSlot()
     def run(self):
         """Main generation logic (runs in worker thread)."""
-        t = None
-        led_completed_externally = False
         try:
             if not DAQ_AVAILABLE:
                 self.error.emit("PyDAQmx is not installed.")
                 return
-
-            if self.mode == "led":
-                self._run_led_mode()
-                led_completed_externally = True
+            if self._build_error is not None:
+                self.error.emit(self._build_error)
                 return
-
-            initial_delay_samples = int(self.initial_trigger_delay * self.sampling_rate)
-            trigger_samples = int(self.trigger_duration * self.sampling_rate)
-            interval_samples = int(self.inter_trigger_interval * self.sampling_rate)
-            samples_per_cycle = trigger_samples + interval_samples
-
-            sig_cycle = np.zeros(samples_per_cycle, dtype=np.float64)
-            sig_cycle[:trigger_samples] = 3.0
-
-            read = c_int32()
-            if self.infinite:
-                if initial_delay_samples > 0:
-                    self.started.emit()
-                    t_delay = self._create_ao_task()
-                    t_delay.CfgSampClkTiming(
-                        "", self.sampling_rate, nidaq.DAQmx_Val_Rising,
-                        nidaq.DAQmx_Val_FiniteSamps, initial_delay_samples)
-                    t_delay.WriteAnalogF64(
-                        initial_delay_samples, False, 10, nidaq.DAQmx_Val_GroupByScanNumber,
-                        np.zeros(initial_delay_samples, dtype=np.float64), byref(read), None)
-                    t_delay.StartTask()
-                    self._wait_until_task_done(
-                        t_delay, self.initial_trigger_delay + 5)
-                    _daq_stop_clear(t_delay)
-                    if self._stop_requested:
-                        t = None
-                    else:
-                        t = self._create_ao_task()
-                        t.CfgSampClkTiming(
-                            "", self.sampling_rate, nidaq.DAQmx_Val_Rising,
-                            nidaq.DAQmx_Val_ContSamps, samples_per_cycle)
-                        t.WriteAnalogF64(
-                            samples_per_cycle, False, 10, nidaq.DAQmx_Val_GroupByScanNumber,
-                            sig_cycle, byref(read), None)
-                        t.StartTask()
-                else:
-                    t = self._create_ao_task()
-                    t.CfgSampClkTiming(
-                        "", self.sampling_rate, nidaq.DAQmx_Val_Rising,
-                        nidaq.DAQmx_Val_ContSamps, samples_per_cycle)
-                    t.WriteAnalogF64(
-                        samples_per_cycle, False, 10, nidaq.DAQmx_Val_GroupByScanNumber,
-                        sig_cycle, byref(read), None)
-                    t.StartTask()
-            else:
-                data = np.concatenate([
-                    np.zeros(initial_delay_samples, dtype=np.float64),
-                    np.tile(sig_cycle, self.nb_triggers),
-                ])
-                nb_samples = len(data)
-                t = self._create_ao_task()
-                t.CfgSampClkTiming(
-                    "", self.sampling_rate, nidaq.DAQmx_Val_Rising,
-                    nidaq.DAQmx_Val_FiniteSamps, nb_samples)
-                t.WriteAnalogF64(
-                    nb_samples, False, 10, nidaq.DAQmx_Val_GroupByScanNumber,
-                    data, byref(read), None)
-                t.StartTask()
-
-            if self.infinite and initial_delay_samples == 0:
-                self.started.emit()
-            elif not self.infinite:
-                self.started.emit()
-
-            if t is not None:
-                if self.infinite:
-                    while not self._stop_requested:
-                        time.sleep(0.1)
-                else:
-                    timeout = (
-                        self.initial_trigger_delay
-                        + self.nb_triggers * (
-                            self.inter_trigger_interval + self.trigger_duration)
-                        + 10)
-                    self._wait_until_task_done(t, timeout)
-
+            try:
+                with self._ao_task() as t:
+                    self._generate(t)
+            finally:
+                self._finalize_output_voltage()
         except Exception as e:
             self.error.emit(str(e))
         finally:
-            if led_completed_externally:
-                pass
-            elif DAQ_AVAILABLE:
-                try:
-                    if t is not None:
-                        _daq_stop_clear(t)
-                except NameError:
-                    pass
-                self._finalize_output_voltage()
-            if not led_completed_externally:
-                self.finished.emit()
-
-    def _idle_voltage_on_exit(self):
-        return self.led_voltage_high if self.mode == "led" else 0.0
-
-    def _run_led_mode(self):
-        """LED train + PWM buffer (led_clignotement_v0.1 logic), continuous or finite repeats."""
-        t = None
-        try:
-            sig_one = build_led_pattern(
-                self.sampling_rate,
-                self.led_train_duration_s,
-                self.led_nb_clignotement,
-                self.led_duty_clignotement,
-                self.led_light_intensity,
-                self.led_inter_train_interval,
-                self.led_voltage_high,
-                self.led_voltage_low,
-            )
-        except ValueError as e:
-            self.error.emit(str(e))
+            self._delay_data = self._cycle = None
             self.finished.emit()
-            return
 
-        read = c_int32()
-        initial_delay_samples = int(self.initial_trigger_delay * self.sampling_rate)
-        v_idle = self.led_voltage_high
-
-        try:
-            if initial_delay_samples > 0:
-                self.started.emit()
-                t_delay = self._create_ao_task()
-                t_delay.CfgSampClkTiming(
-                    "", self.sampling_rate, nidaq.DAQmx_Val_Rising,
-                    nidaq.DAQmx_Val_FiniteSamps, initial_delay_samples)
-                t_delay.WriteAnalogF64(
-                    initial_delay_samples, False, 10, nidaq.DAQmx_Val_GroupByScanNumber,
-                    np.full(initial_delay_samples, v_idle, dtype=np.float64), byref(read), None)
-                t_delay.StartTask()
-                self._wait_until_task_done(
-                    t_delay, self.initial_trigger_delay + 5)
-                _daq_stop_clear(t_delay)
-                if self._stop_requested:
-                    return
-
-            buf_len = len(sig_one)
-            if self.infinite:
-                t = self._create_ao_task()
-                t.CfgSampClkTiming(
-                    "", self.sampling_rate, nidaq.DAQmx_Val_Rising,
-                    nidaq.DAQmx_Val_ContSamps, buf_len)
-                t.WriteAnalogF64(
-                    buf_len, False, 10, nidaq.DAQmx_Val_GroupByScanNumber,
-                    sig_one, byref(read), None)
-                t.StartTask()
-            else:
-                data = np.tile(sig_one, self.nb_triggers)
-                nb_samples = len(data)
-                t = self._create_ao_task()
-                t.CfgSampClkTiming(
-                    "", self.sampling_rate, nidaq.DAQmx_Val_Rising,
-                    nidaq.DAQmx_Val_FiniteSamps, nb_samples)
-                t.WriteAnalogF64(
-                    nb_samples, False, 10, nidaq.DAQmx_Val_GroupByScanNumber,
-                    data, byref(read), None)
-                t.StartTask()
-
-            if initial_delay_samples == 0:
-                self.started.emit()
+    def _generate(self, task):
+        """
+        Initial delay (0 V classic, rest level LED), then loop the cycle until stop
+        (infinite) or for nb_triggers cycles (finite).
+        """
+        if not self.infinite and self._delay_data is not None:
+            self._stream_finite(task)
+            return
+        if self._delay_data is not None:
+            self.started.emit()
+            self._run_initial_delay(task)
+            if self._stop_event.is_set():
+                return
 
-            if t is not None:
-                if self.infinite:
-                    while not self._stop_requested:
-                        time.sleep(0.1)
-                else:
-                    pattern_dur = len(sig_one) / self.sampling_rate
-                    timeout = (
-                        self.initial_trigger_delay
-                        + self.nb_triggers * pattern_dur
-                        + 10
-                    )
-                    self._wait_until_task_done(t, timeout)
+        if self.infinite:
+            self._start_output(task, self._cycle, nidaq.DAQmx_Val_ContSamps)
+        else:
+            self._start_output(
+                task, self._cycle, nidaq.DAQmx_Val_FiniteSamps,
+                self.nb_triggers * len(self._cycle))
+        if self._delay_data is None:
+            self.started.emit()
+
+        if self.infinite:
+            self._stop_event.wait()
+        else:
+            timeout = (
+                self.initial_trigger_delay
+                + self.nb_triggers * len(self._cycle) / self.sampling_rate
+                + 10
+            )
+            self._wait_until_task_done(task, timeout)
 
-        except Exception as e:
-            self.error.emit(str(e))
-        finally:
-            _daq_stop_clear(t)
-            self._finalize_output_voltage()
-            self.finished.emit()
+    def _idle_voltage_on_exit(self):
+        return self.led_voltage_high if self.mode == "led" else 0.0
 
     def _finalize_output_voltage(self):
         """Set AO to idle: 0 V (classic) or LED rest level (LED mode)."""
         if not DAQ_AVAILABLE:
             return
         target_v = self._idle_voltage_on_exit()
-        time.sleep(0.05)
-        t_zero = None
-        try:
-            t_zero = self._create_ao_task()
-            if hasattr(t_zero, 'WriteAnalogScalarF64'):
-                t_zero.StartTask()
-                t_zero.WriteAnalogScalarF64(1, 10.0, target_v, None)
-            else:
-                read_zero = c_int32()
-                t_zero.CfgSampClkTiming("", 1000, nidaq.DAQmx_Val_Rising,
-                                       nidaq.DAQmx_Val_FiniteSamps, 1)
-                t_zero.WriteAnalogF64(1, True, 10, nidaq.DAQmx_Val_GroupByScanNumber,
-                                      np.array([target_v], dtype=np.float64), byref(read_zero), None)
-                try:
-                    t_zero.WaitUntilTaskDone(10.0)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        finally:
-            _daq_stop_clear(t_zero)
+        with self._idle_tasks_lock:
+            t_idle = self._idle_tasks.get(self.device)
+            try:
+                if t_idle is None:
+                    # Channel path changed: keep a task for the current one only.
+                    self._clear_idle_tasks()
+                    t_idle = self._create_ao_task()
+                    self._idle_tasks[self.device] = t_idle
+                self._write_idle_voltage(t_idle, target_v)
+            except Exception:
+                # Drop a task the driver rejected; the next stop recreates it.
+                self._idle_tasks.pop(self.device, None)
+                _daq_stop_clear(t_idle)
+
+    @classmethod
+    def release_idle_tasks(cls):
+        """Stop and clear the cached idle-voltage tasks (when no worker will run again)."""
+        with cls._idle_tasks_lock:
+            cls._clear_idle_tasks()
+
+    @classmethod
+    def _clear_idle_tasks(cls):
+        """Caller holds _idle_tasks_lock."""
+        for task in cls._idle_tasks.values():
+            _daq_stop_clear(task)
+        cls._idle_tasks.clear()
+
+    @staticmethod
+    def _write_idle_voltage(task, target_v):
+        """Write one idle sample, then stop the task so the channel is free for the next run."""
+        if hasattr(task, 'WriteAnalogScalarF64'):
+            task.WriteAnalogScalarF64(1, 10.0, target_v, None)
+        else:
+            _IDLE_SAMPLE[0] = target_v
+            task.CfgSampClkTiming("", 1000, nidaq.DAQmx_Val_Rising,
+                                  nidaq.DAQmx_Val_FiniteSamps, 1)
+            task.WriteAnalogF64(1, True, 10, nidaq.DAQmx_Val_GroupByScanNumber,
+                                _IDLE_SAMPLE, byref(_READ), None)
+            try:
+                task.WaitUntilTaskDone(10.0)
+            except Exception:
+                pass
+        task.StopTask()
+
+
+# Parameter list of DAQWorker(), shared by configure() so it is defined only once.
+_WORKER_SIGNATURE = inspect.signature(DAQWorker.__init__)
@@ -6,14 +6,17 @@ Displays parameters, state indicator, and controls.
 Uses trigger_generator_backend for DAQ logic.
 """
 
-import json
 import math
 import sys
 import time
+from array import array
+from bisect import bisect_right
 from datetime import datetime
 from pathlib import Path
 
-from PyQt5.QtCore import Qt, QThread, QTimer
+from PyQt5.QtCore import (
+    QMetaObject, QObject, QRunnable, Qt, QThread, QThreadPool, QTimer, pyqtSignal,
+)
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -25,7 +28,11 @@ try:
     from .experiment_io import (
         build_experiment_record,
         experiences_dir,
+        has_experiment_file,
+        latest_experiment_file,
+        load_experiment_record,
         save_experiment_record,
+        WorkerParams,
     )
     from .trigger_generator_backend import (
         build_channel_path, DAQWorker, DAQ_AVAILABLE, led_pattern_dimensions,
@@ -34,27 +41,162 @@ except ImportError:
     from experiment_io import (
         build_experiment_record,
         experiences_dir,
+        has_experiment_file,
+        latest_experiment_file,
+        load_experiment_record,
         save_experiment_record,
+        WorkerParams,
     )
     from trigger_generator_backend import (
         build_channel_path, DAQWorker, DAQ_AVAILABLE, led_pattern_dimensions,
     )
 
 
-def _state_frame_stylesheet(bg_hex):
-    return f"QFrame {{ background-color: {bg_hex}; border-radius: 8px; }}"
+# Elapsed-time clock: monotonic, so NTP or manual clock changes cannot make it jump.
+_now = time.monotonic
+
+# State indicator refresh: at least every _TICK_MAX_S (countdown shows 1/100 s), at the
+# end of the current phase if sooner, but never faster than _TICK_MIN_S.
+_TICK_MAX_S = 0.1
+_TICK_MIN_S = 0.03
+# Ticks closer than this are a backlog, not a schedule (coarse timers may fire ~5% early).
+_TICK_BURST_S = 0.02
+
+
+# Indicator phases; text and label stylesheets are built once per phase, and the frame
+# picks its background from a single stylesheet keyed on its "phase" property.
+(
+    _PHASE_DELAY, _PHASE_TRIGGER, _PHASE_INTERVAL,
+    _PHASE_LED_WAIT, _PHASE_LED_TRAIN, _PHASE_LED_PAUSE,
+    _PHASE_DONE,
+) = range(7)
+
+_PHASE_TEXT = {
+    _PHASE_DELAY: "(0 V)",
+    _PHASE_TRIGGER: "Trigger (3 V)",
+    _PHASE_INTERVAL: "0 V (interval)",
+    _PHASE_LED_WAIT: "LED — wait ({:.1f} V rest)",
+    _PHASE_LED_TRAIN: "LED — train (PWM)",
+    _PHASE_LED_PAUSE: "LED — pause entre trains",
+    _PHASE_DONE: "Done",
+}
+# (text colour, frame background)
+_PHASE_COLORS = {
+    _PHASE_DELAY: ("#666", "#e0e0e0"),
+    _PHASE_TRIGGER: ("#1b5e20", "#c8e6c9"),
+    _PHASE_INTERVAL: ("#37474f", "#eceff1"),
+    _PHASE_LED_WAIT: ("#666", "#e0e0e0"),
+    _PHASE_LED_TRAIN: ("#6a1b9a", "#e1bee7"),
+    _PHASE_LED_PAUSE: ("#37474f", "#eceff1"),
+    _PHASE_DONE: ("#666", "#e0e0e0"),
+}
+_PHASE_NAMES = {
+    _PHASE_DELAY: "delay",
+    _PHASE_TRIGGER: "trigger",
+    _PHASE_INTERVAL: "interval",
+    _PHASE_LED_WAIT: "led_wait",
+    _PHASE_LED_TRAIN: "led_train",
+    _PHASE_LED_PAUSE: "led_pause",
+    _PHASE_DONE: "done",
+}
+_PHASE_LABEL_CSS = {ph: f"color: {color};" for ph, (color, _bg) in _PHASE_COLORS.items()}
+_STATE_FRAME_CSS = "\n".join(
+    [
+        "QFrame#stateFrame { background-color: #e0e0e0; border-radius: 8px; }",
+        *(
+            f'QFrame#stateFrame[phase="{_PHASE_NAMES[ph]}"] {{ background-color: {bg}; }}'
+            for ph, (_color, bg) in _PHASE_COLORS.items()
+        ),
+    ]
+)
+
+
+class _PhaseSchedule:
+    """
+    State-indicator timeline, computed once per run.
+    Finite runs are a sorted list of phase end times searched with bisect;
+    infinite runs keep the O(1) modulo on the cycle position.
+    """
+
+    def __init__(self, p):
+        self.initial_delay = p.initial_trigger_delay
+        if p.mode == "led":
+            sr = p.sampling_rate
+            self.on_dur = p.led_train_samples / sr
+            self.cycle_dur = max(1, p.led_timer_samples) / sr
+            self.phases = (_PHASE_LED_WAIT, _PHASE_LED_TRAIN, _PHASE_LED_PAUSE)
+        else:
+            self.on_dur = p.trigger
+            self.cycle_dur = self.on_dur + p.interval
+            self.phases = (_PHASE_DELAY, _PHASE_TRIGGER, _PHASE_INTERVAL)
+        self.breakpoints = None
+        self.kinds = None
+        if not p.infinite:
+            delay_phase, on_phase, off_phase = self.phases
+            breakpoints = array("d", [self.initial_delay])
+            kinds = [delay_phase]
+            for k in range(p.nb_triggers):
+                cycle_start = self.initial_delay + k * self.cycle_dur
+                breakpoints.append(cycle_start + self.on_dur)
+                breakpoints.append(cycle_start + self.cycle_dur)
+                kinds += (on_phase, off_phase)
+            kinds.append(_PHASE_DONE)
+            self.breakpoints = breakpoints
+            self.kinds = bytes(kinds)
+
+    def lookup(self, elapsed):
+        """(phase, seconds left in it) at elapsed; seconds left is None once done."""
+        breakpoints = self.breakpoints
+        if breakpoints is not None:
+            idx = bisect_right(breakpoints, elapsed)
+            if idx == len(breakpoints):
+                return _PHASE_DONE, None
+            return self.kinds[idx], breakpoints[idx] - elapsed
+        delay_phase, on_phase, off_phase = self.phases
+        initial_delay = self.initial_delay
+        if elapsed < initial_delay:
+            return delay_phase, initial_delay - elapsed
+        cycle_dur = self.cycle_dur
+        on_dur = self.on_dur
+        pos_in_cycle = (elapsed - initial_delay) % cycle_dur
+        if pos_in_cycle < on_dur:
+            return on_phase, on_dur - pos_in_cycle
+        return off_phase, cycle_dur - pos_in_cycle
+
+
+_COUNTDOWN_ZERO = "0.00 s"
 
 
 def _format_elapsed(seconds):
-    m = int(seconds // 60)
-    s = seconds % 60
-    return f"{m}:{s:05.2f}"
+    m, s = divmod(seconds, 60)
+    return "%d:%05.2f" % (m, s)
 
 
 def _format_countdown(seconds):
     if seconds <= 0:
-        return "0.00 s"
-    return f"{seconds:.2f} s remaining"
+        return _COUNTDOWN_ZERO
+    return "%.2f s remaining" % seconds
+
+
+class _SaveSignals(QObject):
+    """Lives on the GUI thread so pool-thread emits are queued back to it."""
+    failed = pyqtSignal(str)
+
+
+class _JsonSaveRunnable(QRunnable):
+    """Write one experiment record on a QThreadPool thread."""
+
+    def __init__(self, record, filepath, signals):
+        super().__init__()
+        self.record = record
+        self.filepath = filepath
+        self.signals = signals
+
+    def run(self):
+        try:
+            save_experiment_record(self.record, self.filepath)
+        except Exception as e:
+            self.signals.failed.emit(f"{self.filepath}:\n{e}")
 
 
 class TriggerGeneratorWindow(QMainWindow):
@@ -64,9 +206,18 @@ class TriggerGeneratorWindow(QMainWindow):
         super().__init__()
         self.worker = None
         self.worker_thread = None
+        self._running = False
+        self._closing = False
         self.state_timer = None
         self.state_start_time = None
         self.worker_params = None
+        self._last_phase = None
+        self._last_total_text = None
+        self._last_countdown_text = None
+        self._last_tick = 0.0
+        self._phase_schedule = None
+        self._save_signals = _SaveSignals(self)
+        self._save_signals.failed.connect(self.on_save_failed)
         self.init_ui()
         self.load_params_from_json(silent=True)
 
@@ -252,11 +403,11 @@ class TriggerGeneratorWindow(QMainWindow):
 
         # --- State indicator: shows current phase (Initial trigger delay, Trigger, 0V) + countdown ---
         self.state_frame = QFrame()
+        self.state_frame.setObjectName("stateFrame")
         self.state_frame.setFrameStyle(QFrame.StyledPanel)
         self.state_frame.setMinimumHeight(60)
-        self.state_frame.setStyleSheet("""
-            QFrame { background-color: #e0e0e0; border-radius: 8px; }
-        """)
+        self.state_frame.setProperty("phase", "idle")
+        self.state_frame.setStyleSheet(_STATE_FRAME_CSS)
         state_layout = QVBoxLayout(self.state_frame)
         self.state_label = QLabel("—")
         self.state_label.setAlignment(Qt.AlignCenter)
@@ -342,43 +493,38 @@ class TriggerGeneratorWindow(QMainWindow):
             self.led_train_duration_spin.value(),
             self.led_inter_train_spin.value(),
         )
-        return {
-            "device": device_str,
-            "channel": channel_str,
-            "sampling_rate": sampling_rate,
-            "initial_trigger_delay": initial_trigger_delay,
-            "trigger": trigger_duration,
-            "interval": inter_trigger,
-            "infinite": infinite,
-            "nb_triggers": nb_triggers,
-            "mode": mode,
-            "led_train_samples": led_train_samples,
-            "led_timer_samples": led_timer_samples,
-            "led_train_duration_s": self.led_train_duration_spin.value(),
-            "led_nb_clignotement": int(self.led_nb_cycles_spin.value()),
-            "led_duty_clignotement": self.led_duty_train_spin.value(),
-            "led_light_intensity": self.led_light_intensity_spin.value(),
-            "led_inter_train_interval": self.led_inter_train_spin.value(),
-            "led_voltage_high": self.led_v_high_spin.value(),
-            "led_voltage_low": self.led_v_low_spin.value(),
-        }
+        return WorkerParams(
+            device=device_str,
+            channel=channel_str,
+            sampling_rate=sampling_rate,
+            initial_trigger_delay=initial_trigger_delay,
+            trigger=trigger_duration,
+            interval=inter_trigger,
+            infinite=infinite,
+            nb_triggers=nb_triggers,
+            mode=mode,
+            led_train_samples=led_train_samples,
+            led_timer_samples=led_timer_samples,
+            led_train_duration_s=self.led_train_duration_spin.value(),
+            led_nb_clignotement=int(self.led_nb_cycles_spin.value()),
+            led_duty_clignotement=self.led_duty_train_spin.value(),
+            led_light_intensity=self.led_light_intensity_spin.value(),
+            led_inter_train_interval=self.led_inter_train_spin.value(),
+            led_voltage_high=self.led_v_high_spin.value(),
+            led_voltage_low=self.led_v_low_spin.value(),
+        )
 
     def set_params_enabled(self, enabled):
-        """Enable or disable all parameter fields."""
-        self.mode_combo.setEnabled(enabled)
-        self.device_edit.setEnabled(enabled)
-        self.channel_edit.setEnabled(enabled)
-        self.sampling_rate_spin.setEnabled(enabled)
-        self.classic_pulse_group.setEnabled(enabled)
-        self.initial_trigger_delay_spin.setEnabled(enabled)
-        self.infinite_check.setEnabled(enabled)
-        self.nb_triggers_spin.setEnabled(enabled and not self.infinite_check.isChecked())
+        """Enable or disable all parameter fields (children follow their group box)."""
+        self.params_group.setEnabled(enabled)
         self.led_group.setEnabled(enabled)
         self.load_btn.setEnabled(enabled)
+        if enabled:
+            self.nb_triggers_spin.setEnabled(not self.infinite_check.isChecked())
 
     def start_generation(self):
         """Start DAQ generation in a worker thread."""
-        if self.worker_thread and self.worker_thread.isRunning():
+        if self._running:
             return
 
         # Gather parameters from UI
@@ -413,10 +559,11 @@ class TriggerGeneratorWindow(QMainWindow):
         self.stop_btn.setEnabled(True)
         self.set_params_enabled(False)
 
-        # Create worker and thread
-        self.worker = DAQWorker(
+        worker_args = (
             device, sampling_rate, trigger_duration, inter_trigger,
             infinite, nb_triggers, initial_trigger_delay,
+        )
+        worker_kwargs = dict(
             mode=mode,
             led_train_duration_s=self.led_train_duration_spin.value(),
             led_nb_clignotement=int(self.led_nb_cycles_spin.value()),
@@ -426,13 +573,12 @@ class TriggerGeneratorWindow(QMainWindow):
             led_voltage_high=self.led_v_high_spin.value(),
             led_voltage_low=self.led_v_low_spin.value(),
         )
-        self.worker_thread = QThread()
-        self.worker.moveToThread(self.worker_thread)
-
-        self.worker_thread.started.connect(self.worker.run)
-        self.worker.started.connect(self.on_generation_started)
-        self.worker.finished.connect(self.on_generation_finished)
-        self.worker.error.connect(self.on_generation_error)
+        if self.worker is None:
+            self._create_worker(*worker_args, **worker_kwargs)
+        else:
+            # The worker is idle between runs (_running is False), so configuring it
+            # from this thread does not race with run().
+            self.worker.configure(*worker_args, **worker_kwargs)
 
         self.worker_params = self._worker_params_snapshot(
             self.device_edit.text().strip(),
@@ -445,8 +591,25 @@ class TriggerGeneratorWindow(QMainWindow):
             nb_triggers,
             mode,
         )
+        self._phase_schedule = _PhaseSchedule(self.worker_params)
         self.experiment_start_time = datetime.now()
-        self.worker_thread.start()
+        self._running = True
+        QMetaObject.invokeMethod(self.worker, "run", Qt.QueuedConnection)
+
+    def _create_worker(self, *args, **kwargs):
+        """Create the worker and its thread once; later runs reuse them."""
+        self.worker = DAQWorker(*args, **kwargs)
+        self.worker_thread = QThread()
+        self.worker.moveToThread(self.worker_thread)
+
+        for signal, slot in (
+            (self.worker.started, self.on_generation_started),
+            (self.worker.finished, self.on_generation_finished),
+            (self.worker.error, self.on_generation_error),
+            (self.worker_thread.finished, self._on_thread_finished),
+        ):
+            signal.connect(slot)
+        self.worker_thread.start(QThread.HighPriority)
 
     def stop_generation(self):
         """Request worker to stop generation."""
@@ -455,106 +618,93 @@ class TriggerGeneratorWindow(QMainWindow):
 
     def on_generation_started(self):
         """Start timer to display real-time state (called when DAQ output begins)."""
-        self.state_start_time = time.time()
+        self.state_start_time = _now()
         self.state_timer = QTimer(self)
-        self.state_timer.timeout.connect(self.update_state_indicator)
-        self.state_timer.start(100)
-
-    def update_state_indicator(self):
-        """Update indicator based on current signal phase (called every 100ms)."""
-        if self.state_start_time is None or self.worker_params is None:
+        self.state_timer.setSingleShot(True)
+        # The countdown needs ~10 ms accuracy at most; let the OS coalesce wakeups.
+        self.state_timer.setTimerType(Qt.CoarseTimer)
+        self.state_timer.timeout.connect(self._on_state_tick)
+        self._on_state_tick()
+
+    def _on_state_tick(self):
+        """Refresh the indicator, then re-arm the timer for the next visible change."""
+        if self.state_timer is None:
             return
-        elapsed = time.time() - self.state_start_time
-        self.time_total_label.setText(_format_elapsed(elapsed))
-        p = self.worker_params
-        initial_delay = p["initial_trigger_delay"]
-        sr = p["sampling_rate"]
-
-        if p.get("mode") == "led":
-            vh = p.get("led_voltage_high", 3.0)
-            train_s = p.get("led_train_samples", 1)
-            timer_s = max(1, p.get("led_timer_samples", 1))
-            train_dur = train_s / sr
-            cycle_dur = timer_s / sr
-            if elapsed < initial_delay:
-                text = f"LED — wait ({vh:.1f} V rest)"
-                color, bg = "#666", "#e0e0e0"
-                remaining = initial_delay - elapsed
-                countdown = _format_countdown(remaining)
-            else:
-                t_loop = elapsed - initial_delay
-                if not p["infinite"]:
-                    total_dur = p["nb_triggers"] * cycle_dur
-                    if t_loop >= total_dur:
-                        text, color, bg = "Done", "#666", "#e0e0e0"
-                        self.state_label.setText(text)
-                        self.state_label.setStyleSheet(f"color: {color};")
-                        self.state_frame.setStyleSheet(_state_frame_stylesheet(bg))
-                        self.time_label.setText("—")
-                        return
-                pos = t_loop % cycle_dur
-                if pos < train_dur:
-                    text, color, bg = "LED — train (PWM)", "#6a1b9a", "#e1bee7"
-                    remaining = train_dur - pos
-                else:
-                    text, color, bg = "LED — pause entre trains", "#37474f", "#eceff1"
-                    remaining = cycle_dur - pos
-                countdown = _format_countdown(remaining)
-            self.state_label.setText(text)
-            self.state_label.setStyleSheet(f"color: {color};")
-            self.state_frame.setStyleSheet(_state_frame_stylesheet(bg))
-            self.time_label.setText(countdown)
+        now = _now()
+        since_last = now - self._last_tick
+        if since_last < _TICK_BURST_S:
+            # Back-to-back tick (e.g. after an event-loop stall): skip it, keep the spacing.
+            self.state_timer.start(math.ceil((_TICK_MIN_S - since_last) * 1000))
             return
+        self._last_tick = now
+        remaining = self.update_state_indicator()
+        if remaining is None:
+            return
+        delay = max(_TICK_MIN_S, min(remaining, _TICK_MAX_S))
+        self.state_timer.start(int(delay * 1000))
 
-        trigger, interval = p["trigger"], p["interval"]
-        cycle_duration = trigger + interval
-
-        # Phase 1: Initial delay (0 V in classic mode)
-        if elapsed < initial_delay:
-            text, color, bg = "(0 V)", "#666", "#e0e0e0"
-            remaining = initial_delay - elapsed
-            countdown = _format_countdown(remaining)
-        else:
-            # Phase 2: Trigger or interval
-            cycle_time = elapsed - initial_delay
-            if p["infinite"]:
-                pos_in_cycle = cycle_time % cycle_duration
-            else:
-                total_cycles = p["nb_triggers"] * cycle_duration
-                if cycle_time >= total_cycles:
-                    # All triggers done
-                    text, color, bg = "Done", "#666", "#e0e0e0"
-                    self.state_label.setText(text)
-                    self.state_label.setStyleSheet(f"color: {color};")
-                    self.state_frame.setStyleSheet(_state_frame_stylesheet(bg))
-                    self.time_label.setText("—")
-                    return
-                pos_in_cycle = cycle_time % cycle_duration
-
-            if pos_in_cycle < trigger:
-                text, color, bg = "Trigger (3 V)", "#1b5e20", "#c8e6c9"
-                remaining = trigger - pos_in_cycle
-            else:
-                text, color, bg = "0 V (interval)", "#37474f", "#eceff1"
-                remaining = cycle_duration - pos_in_cycle
-            countdown = _format_countdown(remaining)
-
+    def update_state_indicator(self):
+        """
+        Update indicator based on current signal phase.
+        Returns seconds left in the phase, or None when done (no further refresh needed).
+        """
+        start_time = self.state_start_time
+        schedule = self._phase_schedule
+        if start_time is None or schedule is None:
+            return None
+        elapsed = _now() - start_time
+        total_text = _format_elapsed(elapsed)
+        if total_text != self._last_total_text:
+            self._last_total_text = total_text
+            self.time_total_label.setText(total_text)
+        phase, remaining = schedule.lookup(elapsed)
+        if phase != self._last_phase:
+            self._apply_phase(phase)
+        countdown = "—" if remaining is None else _format_countdown(remaining)
+        if countdown != self._last_countdown_text:
+            self._last_countdown_text = countdown
+            self.time_label.setText(countdown)
+        return remaining
+
+    def _apply_phase(self, phase):
+        """Set state text and colours for phase (called only when the phase changes)."""
+        self._last_phase = phase
+        text = _PHASE_TEXT[phase]
+        if phase == _PHASE_LED_WAIT:
+            text = text.format(self.worker_params.led_voltage_high)
         self.state_label.setText(text)
-        self.state_label.setStyleSheet(f"color: {color};")
-        self.state_frame.setStyleSheet(_state_frame_stylesheet(bg))
-        self.time_label.setText(countdown)
+        self.state_label.setStyleSheet(_PHASE_LABEL_CSS[phase])
+        self._set_frame_phase(_PHASE_NAMES[phase])
+
+    def _set_frame_phase(self, name):
+        """Switch the frame background by property; only the frame is re-polished."""
+        frame = self.state_frame
+        frame.setProperty("phase", name)
+        style = frame.style()
+        style.unpolish(frame)
+        style.polish(frame)
+        frame.update()
 
     def save_params_to_json(self, duration_seconds):
-        """Save parameters and experiment info to a JSON file (on generation stop)."""
+        """
+        Save parameters and experiment info to a JSON file (on generation stop).
+        The record is built here; the file is written on a pool thread.
+        """
         if self.worker_params is None:
             return
-        exp_time = getattr(self, "experiment_start_time", datetime.now())
+        now = datetime.now()
+        exp_time = getattr(self, "experiment_start_time", now)
         record = build_experiment_record(
-            self.worker_params, duration_seconds, exp_time, datetime.now()
+            self.worker_params, duration_seconds, exp_time, now
         )
         save_dir = experiences_dir()
         filename = exp_time.strftime("trigger_generator_%Y-%m-%d_%H-%M-%S.json")
-        save_experiment_record(record, save_dir / filename)
+        QThreadPool.globalInstance().start(
+            _JsonSaveRunnable(record, save_dir / filename, self._save_signals))
+
+    def on_save_failed(self, msg):
+        """Report a background save failure (runs on the GUI thread)."""
+        QMessageBox.warning(self, "Save", f"Failed to save experiment parameters:\n{msg}")
 
     def load_params_from_json(self, silent=False):
         """Load parameters from a JSON file.
@@ -565,15 +715,15 @@ class TriggerGeneratorWindow(QMainWindow):
             if not silent:
                 QMessageBox.warning(self, "Load", "No experiments folder found.")
             return
-        json_files = list(save_dir.glob("trigger_generator_*.json")) + list(save_dir.glob("wavegene_*.json"))
-        if not json_files:
-            if not silent:
-                QMessageBox.warning(self, "Load", "No experiment file found.")
-            return
-
         if silent:
-            path = max(json_files, key=lambda p: p.stat().st_mtime)
+            path = latest_experiment_file(save_dir)
+            if path is None:
+                return
         else:
+            # The dialog only needs to know a file exists; don't stat every file.
+            if not has_experiment_file(save_dir):
+                QMessageBox.warning(self, "Load", "No experiment file found.")
+                return
             path_str, _ = QFileDialog.getOpenFileName(
                 self, "Load Parameters",
                 str(save_dir),
@@ -584,8 +734,7 @@ class TriggerGeneratorWindow(QMainWindow):
             path = Path(path_str)
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_experiment_record(path)
             self.device_edit.setText(data.get("device", "Dev2"))
             self.channel_edit.setText(data.get("channel", "ao0"))
             self.sampling_rate_spin.setValue(data.get("sampling_rate", 1000))
@@ -619,31 +768,51 @@ class TriggerGeneratorWindow(QMainWindow):
             self.state_timer = None
         duration = 0
         if self.state_start_time is not None:
-            duration = time.time() - self.state_start_time
+            duration = _now() - self.state_start_time
             self.save_params_to_json(duration)
         self.state_start_time = None
+        self._last_phase = None
+        self._last_total_text = None
+        self._last_countdown_text = None
         self.state_label.setText("—")
         self.time_label.setText("—")
         self.time_total_label.setText("0:00")
         self.state_label.setStyleSheet("color: #666;")
-        self.time_label.setStyleSheet("color: #666;")
-        self.state_frame.setStyleSheet(_state_frame_stylesheet("#e0e0e0"))
-        if self.worker_thread:
-            self.worker_thread.quit()
-            self.worker_thread.wait(2000)
+        self._set_frame_phase("idle")
+        self._running = False
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.set_params_enabled(True)
 
     def on_generation_error(self, msg):
-        """Handle DAQ or worker error: cleanup and show message."""
-        self.on_generation_finished()
+        """Show a DAQ or worker error; the worker emits finished next, which cleans up."""
         QMessageBox.critical(self, "Error", msg)
 
+    def closeEvent(self, event):
+        """
+        Stop any running generation and shut down the worker thread without blocking:
+        the close is deferred until the thread has finished (see _on_thread_finished).
+        """
+        if self.worker_thread is not None and self.worker_thread.isRunning():
+            event.ignore()
+            if not self._closing:
+                self._closing = True
+                self.worker.stop()
+                # Handled once run() has returned and the output is back at idle.
+                self.worker_thread.quit()
+            return
+        super().closeEvent(event)
+
+    def _on_thread_finished(self):
+        """Worker thread has exited: release DAQ tasks and complete a close deferred by closeEvent."""
+        DAQWorker.release_idle_tasks()
+        if self._closing:
+            self.close()
+
 
 def main():
     """Application entry point."""
-    app = QApplication([])
+    app = QApplication(sys.argv)
     app.setStyle("Fusion")
     window = TriggerGeneratorWindow()
     window.show()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Record file lookup and the save/load round trip (orjson and stdlib json)."""
+
+import json
+import os
+
+import pytest
+
+from electric_stimulation import experiment_io
+
+
+def _touch(path, mtime):
+    path.write_text("{}", encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+def test_latest_experiment_file(tmp_path):
+    _touch(tmp_path / "trigger_generator_a.json", 1000)
+    _touch(tmp_path / "wavegene_b.json", 3000)
+    _touch(tmp_path / "trigger_generator_c.json", 2000)
+    _touch(tmp_path / "other_d.json", 9000)
+    _touch(tmp_path / "trigger_generator_e.txt", 9000)
+    assert experiment_io.latest_experiment_file(tmp_path) == tmp_path / "wavegene_b.json"
+
+
+def test_latest_experiment_file_none(tmp_path):
+    _touch(tmp_path / "notes.json", 1000)
+    assert experiment_io.latest_experiment_file(tmp_path) is None
+    assert experiment_io.latest_experiment_file(tmp_path / "missing") is None
+
+
+def test_has_experiment_file(tmp_path):
+    assert not experiment_io.has_experiment_file(tmp_path)
+    assert not experiment_io.has_experiment_file(tmp_path / "missing")
+    _touch(tmp_path / "notes.json", 1000)
+    assert not experiment_io.has_experiment_file(tmp_path)
+    _touch(tmp_path / "trigger_generator_x.json", 1000)
+    assert experiment_io.has_experiment_file(tmp_path)
+
+
+RECORD = {
+    "device": "Dev2",
+    "sampling_rate": 1000,
+    "trigger_duration": 0.2,
+    "infinite": False,
+    "mode": "led",
+    "led_voltage_low": 0.0,
+    "note": "pause entre trains — é",
+}
+
+
+def _stdlib_json(monkeypatch):
+    monkeypatch.setattr(
+        experiment_io, "_json_loads", lambda data: json.loads(data))
+    monkeypatch.setattr(
+        experiment_io, "_json_dumps",
+        lambda obj: json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8"))
+
+
+@pytest.mark.parametrize("backend", ["default", "stdlib"])
+def test_save_load_round_trip(tmp_path, monkeypatch, backend):
+    if backend == "stdlib":
+        _stdlib_json(monkeypatch)
+    path = tmp_path / "experiences" / "trigger_generator_x.json"
+    experiment_io.save_experiment_record(RECORD, path)
+    assert experiment_io.load_experiment_record(path) == RECORD
+    # Same file content as the original json.dump(indent=2, ensure_ascii=False).
+    assert json.loads(path.read_text(encoding="utf-8")) == RECORD
+    assert "é" in path.read_text(encoding="utf-8")
+
+
+def test_orjson_and_stdlib_files_interchangeable(tmp_path, monkeypatch):
+    pytest.importorskip("orjson")
+    path = tmp_path / "trigger_generator_x.json"
+    experiment_io.save_experiment_record(RECORD, path)
+    _stdlib_json(monkeypatch)
+    assert experiment_io.load_experiment_record(path) == RECORD
+
+
+def test_worker_params_rejects_missing_and_unknown():
+    params = {name: 0 for name in experiment_io.WorkerParams.__slots__}
+    experiment_io.WorkerParams(**params)
+    with pytest.raises(TypeError):
+        experiment_io.WorkerParams(**dict(params, extra=1))
+    del params["device"]
+    with pytest.raises(TypeError):
+        experiment_io.WorkerParams(**params)
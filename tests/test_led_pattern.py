@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""build_led_pattern against the original per-blink mask loop."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from electric_stimulation.led_pattern import build_led_pattern, led_pattern_dimensions
+
+
+def _reference_led_pattern(sampling_rate_hz, train_duration_s, n_cycles, train_duty,
+                           light_intensity, inter_train_interval_s,
+                           voltage_high=3.0, voltage_low=0.0):
+    """The loop-based implementation the vectorized one replaced."""
+    train_samples, timer = led_pattern_dimensions(
+        sampling_rate_hz, train_duration_s, inter_train_interval_s
+    )
+    sig = np.full(timer, voltage_high, dtype=np.float64)
+    if train_samples <= 0 or light_intensity <= 0:
+        return sig
+    n_cycles = int(n_cycles)
+    base = train_samples // n_cycles
+    rem = train_samples % n_cycles
+    lengths = np.full(n_cycles, base, dtype=np.intp)
+    lengths[:rem] = base + 1
+    starts = np.zeros(n_cycles, dtype=np.intp)
+    starts[1:] = np.cumsum(lengths[:-1])
+    pulse_w = int(np.ceil(train_samples / float(n_cycles) * train_duty))
+    pulse_w = max(0, min(pulse_w, base))
+    if pulse_w <= 0:
+        return sig
+    ws = np.minimum(pulse_w, lengths)
+    active = np.zeros(train_samples, dtype=bool)
+    for k in range(n_cycles):
+        active[starts[k]:starts[k] + ws[k]] = True
+    idx_on = np.flatnonzero(active)
+    l_act = int(idx_on.size)
+    k_low = max(0, min(l_act, int(round(l_act * light_intensity))))
+    if k_low >= l_act:
+        sig[idx_on] = voltage_low
+    elif k_low > 0:
+        i = np.arange(l_act, dtype=np.intp)
+        pick = (i + 1) * k_low // l_act > i * k_low // l_act
+        sig[idx_on[pick]] = voltage_low
+    return sig
+
+
+@pytest.mark.parametrize(
+    "sampling_rate, train_duration, n_cycles, duty, intensity",
+    list(itertools.product(
+        (997, 1000, 10000),
+        (0.013, 0.25, 1.0),
+        (1, 3, 7),
+        (0.0, 0.1, 0.5, 1.0),
+        (0.0, 0.33, 0.5, 1.0),
+    )),
+)
+def test_matches_reference(sampling_rate, train_duration, n_cycles, duty, intensity):
+    args = (sampling_rate, train_duration, n_cycles, duty, intensity, 0.4, 2.5, 0.2)
+    np.testing.assert_array_equal(build_led_pattern(*args), _reference_led_pattern(*args))
+
+
+def test_too_many_blinks_rejected():
+    with pytest.raises(ValueError):
+        build_led_pattern(100, 0.01, 5, 0.5, 1.0, 0.0)
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""DAQWorker buffers and the finite stream, checked without hardware."""
+
+import types
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from electric_stimulation import trigger_generator_backend as backend  # noqa: E402
+from electric_stimulation.trigger_generator_backend import DAQWorker  # noqa: E402
+
+
+class _FakeTask:
+    """Records what the worker writes; finishes as soon as it is waited on."""
+
+    def __init__(self):
+        self.writes = []
+        self.started_after = None
+        self.total = None
+        self.buf_len = None
+
+    def CfgSampClkTiming(self, source, rate, edge, sample_mode, nb_samples):
+        self.total = nb_samples
+
+    def SetWriteRegenMode(self, mode):
+        self.regen = mode
+
+    def CfgOutputBuffer(self, nb_samples):
+        self.buf_len = nb_samples
+
+    def WriteAnalogF64(self, n, auto_start, timeout, layout, data, read, reserved):
+        assert len(data) == n
+        self.writes.append(np.array(data))
+
+    def StartTask(self):
+        self.started_after = sum(len(w) for w in self.writes)
+
+    def WaitUntilTaskDone(self, timeout):
+        pass
+
+
+@pytest.fixture
+def fake_nidaq(monkeypatch):
+    monkeypatch.setattr(backend, "nidaq", types.SimpleNamespace(
+        DAQmx_Val_Rising=1, DAQmx_Val_FiniteSamps=2, DAQmx_Val_DoNotAllowRegen=3,
+        DAQmx_Val_GroupByScanNumber=4,
+    ))
+
+
+def _expected_stream(worker):
+    delay = np.full(worker._delay_samples, worker._delay_data[0])
+    return np.concatenate([delay, np.tile(worker._cycle, worker.nb_triggers)])
+
+
+CASES = [
+    # sampling_rate, initial_delay, nb_triggers, mode
+    (1000, 0.35, 3, "classic"),
+    (1000, 5.0, 7, "classic"),
+    (10000, 0.0005, 4, "classic"),
+    (997, 2.3, 1, "led"),
+    (1000, 0.05, 20, "led"),
+]
+
+
+@pytest.mark.parametrize("sampling_rate, delay, nb_triggers, mode", CASES)
+def test_stream_chunks_are_delay_then_cycles(sampling_rate, delay, nb_triggers, mode):
+    worker = DAQWorker("Dev1/ao0", sampling_rate, 0.2, 0.5, False, nb_triggers, delay,
+                       mode=mode, led_voltage_high=2.5)
+    expected = _expected_stream(worker)
+    for block in (1, 7, 100, len(expected)):
+        chunks = [worker._stream_chunk(pos, min(block, len(expected) - pos))
+                  for pos in range(0, len(expected), block)]
+        np.testing.assert_array_equal(np.concatenate(chunks), expected)
+
+
+@pytest.mark.parametrize("sampling_rate, delay, nb_triggers, mode", CASES)
+def test_stream_finite_writes_one_clocked_run(
+        fake_nidaq, sampling_rate, delay, nb_triggers, mode):
+    worker = DAQWorker("Dev1/ao0", sampling_rate, 0.2, 0.5, False, nb_triggers, delay,
+                       mode=mode)
+    task = _FakeTask()
+    worker._generate(task)
+    expected = _expected_stream(worker)
+    assert task.total == len(expected)
+    # Started once, with exactly one full buffer prefilled.
+    assert task.started_after == task.buf_len
+    np.testing.assert_array_equal(np.concatenate(task.writes), expected)
+
+
+def test_stop_ends_stream_between_blocks(fake_nidaq):
+    worker = DAQWorker("Dev1/ao0", 1000, 0.2, 0.5, False, 50, 2.0)
+    task = _FakeTask()
+    worker.stop()
+    worker._generate(task)
+    assert len(task.writes) == 1
+    assert len(task.writes[0]) < task.total
+
+
+def test_configure_resets_for_next_run():
+    worker = DAQWorker("Dev1/ao0", 1000, 0.2, 0.5, False, 3, 1.0)
+    worker.stop()
+    worker.configure("Dev1/ao1", 2000, 0.1, 0.2, True, 1)
+    assert worker.device == "Dev1/ao1"
+    assert worker.mode == "classic"
+    assert worker.initial_trigger_delay == 5.0
+    assert not worker._stop_event.is_set()
+    assert len(worker._cycle) == 600
+
+
+def test_build_failure_is_reported_not_raised():
+    worker = DAQWorker("Dev1/ao0", 100, 0.2, 0.5, False, 1, 0.0, mode="led",
+                       led_train_duration_s=0.01, led_nb_clignotement=5)
+    assert worker._build_error
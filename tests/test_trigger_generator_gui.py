@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""_PhaseSchedule against the per-tick modulo arithmetic it replaced."""
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from electric_stimulation.experiment_io import WorkerParams  # noqa: E402
+from electric_stimulation.trigger_generator_gui import (  # noqa: E402
+    _PHASE_DELAY, _PHASE_DONE, _PHASE_INTERVAL, _PHASE_LED_PAUSE, _PHASE_LED_TRAIN,
+    _PHASE_LED_WAIT, _PHASE_TRIGGER, _PhaseSchedule,
+)
+
+
+def _params(**overrides):
+    params = dict(
+        device="Dev2", channel="ao0", sampling_rate=1000, initial_trigger_delay=1.5,
+        trigger=0.2, interval=0.7, infinite=False, nb_triggers=4, mode="classic",
+        led_train_samples=250, led_timer_samples=900, led_train_duration_s=0.25,
+        led_nb_clignotement=3, led_duty_clignotement=0.5, led_light_intensity=1.0,
+        led_inter_train_interval=0.65, led_voltage_high=3.0, led_voltage_low=0.0,
+    )
+    params.update(overrides)
+    return WorkerParams(**params)
+
+
+def _reference(p, elapsed):
+    """(phase, remaining) as the original update_state_indicator computed them."""
+    if p.mode == "led":
+        on_dur = p.led_train_samples / p.sampling_rate
+        cycle_dur = max(1, p.led_timer_samples) / p.sampling_rate
+        phases = (_PHASE_LED_WAIT, _PHASE_LED_TRAIN, _PHASE_LED_PAUSE)
+    else:
+        on_dur = p.trigger
+        cycle_dur = p.trigger + p.interval
+        phases = (_PHASE_DELAY, _PHASE_TRIGGER, _PHASE_INTERVAL)
+    if elapsed < p.initial_trigger_delay:
+        return phases[0], p.initial_trigger_delay - elapsed
+    t_loop = elapsed - p.initial_trigger_delay
+    if not p.infinite and t_loop >= p.nb_triggers * cycle_dur:
+        return _PHASE_DONE, None
+    pos = t_loop % cycle_dur
+    if pos < on_dur:
+        return phases[1], on_dur - pos
+    return phases[2], cycle_dur - pos
+
+
+@pytest.mark.parametrize("mode", ["classic", "led"])
+@pytest.mark.parametrize("infinite", [False, True])
+def test_lookup_matches_reference(mode, infinite):
+    p = _params(mode=mode, infinite=infinite)
+    schedule = _PhaseSchedule(p)
+    # Sample off the phase boundaries, where float rounding may legitimately differ.
+    for i in range(1, 1200):
+        elapsed = i * 0.00731
+        phase, remaining = schedule.lookup(elapsed)
+        ref_phase, ref_remaining = _reference(p, elapsed)
+        assert phase == ref_phase, elapsed
+        if ref_remaining is None:
+            assert remaining is None
+        else:
+            assert remaining == pytest.approx(ref_remaining, abs=1e-9)
+
+
+def test_finite_run_ends_done():
+    schedule = _PhaseSchedule(_params(nb_triggers=2))
+    assert schedule.lookup(1.5 + 2 * 0.9 + 0.01) == (_PHASE_DONE, None)